@@ -1,22 +1,36 @@
 #! /usr/bin/env python3
 import datetime
 import enum
-import filecmp
-import inspect
+import itertools
 import logging
-import logging.config
 import os
 import shutil
+import signal
 import subprocess
+import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 PYTHON_REQUIRED = "3.8"
 VERSION = '0.0.1-alpha'
 __version__ = VERSION
 NAME = "siot"
 
+# Default size of the RAM-backed workspace storage (bytes)
+RAM_BUDGET_DEFAULT = 256 * 1024 * 1024
+# Part of the RAM budget reserved for a single running execution (bytes)
+RAM_RESERVE_DEFAULT = 16 * 1024 * 1024
+# Size of the chunk used when comparing outputs (bytes)
+STREAM_CHUNK_SIZE = 64 * 1024
+# Max. number of executions used to minimize a single fuzzing finding
+FUZZ_MINIMIZE_STEPS = 200
+# Time to wait for the output capture after the process exited or was killed (seconds)
+TIMELINE_KILL_GRACE = 1.0
+# Directories that are not watched for the source changes
+WATCH_IGNORE = {'build', '__pycache__'}
+
 # Logging specific stuff
 LOG = logging.getLogger(NAME)
 
@@ -111,6 +125,7 @@ class Content:
         """
         other = other if other else Content(**kw)
         if other.file and self.file:
+            import filecmp  # pylint: disable=import-outside-toplevel
             assert filecmp.cmp(str(other.file), str(self.file))
         if other._text is not None or self._text is not None:
             assert self.text() == other.text()
@@ -128,6 +143,7 @@ class Content:
 
     def __eq__(self, other: 'Content') -> bool:
         if other.file is not None and self.file is not None:
+            import filecmp  # pylint: disable=import-outside-toplevel
             return filecmp.cmp(other.file, self.file)
         return self.binary() == other.binary()
 
@@ -173,13 +189,94 @@ class ExecParams:
 
 
 class Workspace:
-    def __init__(self, workspace: Path = None):
+    def __init__(self, workspace: Path = None, ram_path: Union[Path, str] = None, ram_budget: int = None,
+                 ram_reserve: int = None):
         """Creates an instance of the workspace
         workspace defines where the executable output will be stored
         :param workspace: Location where the executable (stdout, stderr) will be stored
+        :param ram_path: Optional RAM-backed location (for example ``/dev/shm``)
+            where the execution outputs are stored first
+        :param ram_budget: Max. number of bytes stored in the ``ram_path``,
+            when exceeded the outputs are stored in the ``workspace``
+        :param ram_reserve: Part of the budget reserved for each running execution,
+            it limits the number of the parallel executions writing to the ``ram_path``.
+            Output of a single execution is not limited, so it can exceed the budget
+            (it is moved to the ``workspace`` when it finishes)
         """
         self.ws_path = workspace
         self.execs: List['Executable'] = []
+        self.ram_budget: int = ram_budget if ram_budget is not None else RAM_BUDGET_DEFAULT
+        self.ram_reserve: int = min(ram_reserve if ram_reserve is not None else RAM_RESERVE_DEFAULT,
+                                    self.ram_budget)
+        self.ram_path: Optional[Path] = None
+        self._ram_results: List['CommandResult'] = []
+        self._ram_persist: List['CommandResult'] = []
+        self._ram_used: int = 0
+        self._ram_lock = threading.Lock()
+        if ram_path is not None:
+            import tempfile  # pylint: disable=import-outside-toplevel
+            self.ram_path = Path(tempfile.mkdtemp(prefix=f"{NAME}_", dir=str(ram_path)))
+
+    def __enter__(self) -> 'Workspace':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Releases the RAM-backed storage
+        Outputs of the failed executions (non-zero exit code) and of the executions
+        marked by ``persist`` are copied to the workspace path, the rest of the outputs is removed
+        """
+        if self.ram_path is None:
+            return
+        for res in self._ram_results:
+            if res.exit != 0 or res in self._ram_persist:
+                LOG.debug("[WS] Persisting outputs of the execution: %s", res)
+                self._move_result(res, self.ws_path)
+        shutil.rmtree(self.ram_path, ignore_errors=True)
+        self._ram_results = []
+        self._ram_persist = []
+        self._ram_used = 0
+        self.ram_path = None
+
+    def persist(self, res: 'CommandResult'):
+        """Marks the execution outputs to be kept in the workspace path on ``close``
+        Use it for the failed executions with zero exit code (for example unexpected output)
+        :param res: Execution result
+        """
+        with self._ram_lock:
+            if res not in self._ram_persist:
+                self._ram_persist.append(res)
+
+    def _reserve_output_path(self) -> Path:
+        with self._ram_lock:
+            if self.ram_path is not None and self._ram_used + self.ram_reserve <= self.ram_budget:
+                self._ram_used += self.ram_reserve
+                return self.ram_path
+        return self.ws_path
+
+    def _release_reserve(self):
+        with self._ram_lock:
+            self._ram_used -= self.ram_reserve
+
+    def _track_result(self, res: 'CommandResult'):
+        size = res.out().size() + res.err().size()
+        with self._ram_lock:
+            self._ram_used += size - self.ram_reserve
+            if self._ram_used > self.ram_budget:
+                # Budget exhausted - spill this result to the disk and free its space
+                LOG.info("[WS] RAM budget (%d bytes) exceeded, storing outputs in \"%s\"",
+                         self.ram_budget, self.ws_path)
+                self._move_result(res, self.ws_path)
+                self._ram_used -= size
+                return
+            self._ram_results.append(res)
+
+    @staticmethod
+    def _move_result(res: 'CommandResult', target: Path):
+        res.stdout = Path(shutil.move(str(res.stdout), str(target / res.stdout.name)))
+        res.stderr = Path(shutil.move(str(res.stderr), str(target / res.stderr.name)))
 
     def executable(self, path: Union[Path, str]) -> 'Executable':
         """Register a new executable
@@ -198,15 +295,34 @@ class Workspace:
         :return: Execution result
         """
         params = params if params else ExecParams(**kw)
-        LOG.info("[EXEC] Executing \"%s\" with workspace path \"%s\"", cmd, self.ws_path)
-        params = params if params is not None else ExecParams()
-        res = execute_cmd(
-            str(cmd),
-            args=params.args,
-            stdin=params.stdin,
-            ws=self.ws_path,
-            **params.other,
-        )
+        ws = self._reserve_output_path()
+        LOG.info("[EXEC] Executing \"%s\" with workspace path \"%s\"", cmd, ws)
+        other = dict(params.other)
+        nm = other.pop('nm', None) or _exec_name(str(cmd))
+        stdout = other.pop('stdout', None) or ws / f'{nm}.stdout'
+        stderr = other.pop('stderr', None) or ws / f'{nm}.stderr'
+        try:
+            res = execute_cmd(
+                str(cmd),
+                args=params.args,
+                stdin=params.stdin,
+                env=params.env,
+                ws=ws,
+                stdout=stdout,
+                stderr=stderr,
+                **other,
+            )
+        except Exception as ex:
+            if ws == self.ram_path:
+                self._release_reserve()
+                # Timed-out execution is a failed one - keep its outputs
+                if isinstance(ex, subprocess.TimeoutExpired):
+                    for path in (stdout, stderr):
+                        if path.exists() and path.parent == self.ram_path:
+                            shutil.move(str(path), str(self.ws_path / path.name))
+            raise
+        if ws == self.ram_path:
+            self._track_result(res)
         return res
 
     def req_exec(self, cmd: Union[Path, str], params: 'ExecParams' = None, **kw):
@@ -217,6 +333,33 @@ class Workspace:
             LOG.warning("STDERR: %s", res.err().text())
             raise RuntimeError(f"Command failed: {cmd}")
 
+    def differential(self, reference_exe: Union[Path, str, 'Executable'],
+                     candidate_exe: Union[Path, str, 'Executable'],
+                     cases: List['ExecParams'], jobs: int = None) -> 'DiffResult':
+        """Execute the reference and the candidate executable on the same cases
+        Both executables are executed concurrently, the exit codes and outputs are compared
+        :param reference_exe: Reference executable (expected behaviour)
+        :param candidate_exe: Candidate executable (for example optimized build)
+        :param cases: List of execution parameters
+        :param jobs: Max. number of concurrent executions (default: 2)
+        :return: Differential result with the mismatches and the speedup
+        """
+        reference = self._as_executable(reference_exe)
+        candidate = self._as_executable(candidate_exe)
+        LOG.info("[DIFF] Reference \"%s\" vs candidate \"%s\" (%d cases)",
+                 reference.exe, candidate.exe, len(cases))
+        from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+        with ThreadPoolExecutor(max_workers=jobs or 2) as pool:
+            futures = [(params, pool.submit(_diff_exec, reference, params), pool.submit(_diff_exec, candidate, params))
+                       for params in cases]
+            result = DiffResult([DiffCase(params, ref.result(), cand.result()) for params, ref, cand in futures])
+        for case in result.mismatches:
+            LOG.warning("[DIFF] Mismatch: %s", case)
+        return result
+
+    def _as_executable(self, exe: Union[Path, str, 'Executable']) -> 'Executable':
+        return exe if isinstance(exe, Executable) else Executable(exe, workspace=self)
+
 
 class Executable:
     def __init__(self, executable: Path, workspace: 'Workspace' = None):
@@ -232,6 +375,77 @@ class Executable:
             params = ExecParams(args=args, stdin=stdin, **kwargs)
         return self.workspace.execute(self.exe, params)
 
+    def fuzz(self, seeds: List[Union[Path, str, Content]] = None, args: List[str] = None,
+             iterations: int = 100, jobs: int = None, timeout: int = 10,
+             slow_factor: float = 10.0, seed: int = None, cases_dir: Path = None) -> 'FuzzResult':
+        """Fuzz the executable standard input
+        The seeds are mutated and executed in parallel, crashes (negative exit code - signal),
+        timeouts and elapsed time outliers are reported.
+        Each unique finding (kind and exit code) is minimized using delta debugging
+        (the candidate inputs of each step are executed in parallel)
+        and stored as a data-driven case (``<name>.in`` and ``<name>.json``)
+        :param seeds: Initial stdin contents (files or Content), default is an empty input
+        :param args: Executable arguments used for every execution
+        :param iterations: Number of the mutated inputs
+        :param jobs: Max. number of parallel executions
+        :param timeout: Execution timeout in seconds
+        :param slow_factor: Execution is an outlier if its elapsed time is
+            ``slow_factor`` times higher than the median
+        :param seed: Random generator seed (reproducible fuzzing)
+        :param cases_dir: Where the findings are stored (default: ``<workspace>/fuzz``)
+        :return: Fuzzing result with minimized findings
+        """
+        import random  # pylint: disable=import-outside-toplevel
+        import statistics  # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+        rng = random.Random(seed)
+        seeds = [Content(file=s) if isinstance(s, (Path, str)) else s for s in (seeds or [Content(binary=b'')])]
+        inputs = [s.binary() or b'' for s in seeds]
+        inputs += [_mutate(rng.choice(inputs[:len(seeds)]), rng) for _ in range(iterations)]
+        LOG.info("[FUZZ] Fuzzing \"%s\" with %d inputs", self.exe, len(inputs))
+
+        cases_dir = Path(cases_dir) if cases_dir else self.workspace.ws_path / 'fuzz'
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            runs = list(pool.map(lambda data: (data, self._fuzz_exec(data, args, timeout)), inputs))
+
+            elapsed = [res.elapsed for _, res in runs if res is not None]
+            slow_limit = statistics.median(elapsed) * slow_factor if elapsed else None
+            findings: Dict[Any, FuzzFinding] = {}
+            for data, res in runs:
+                kind = _fuzz_classify(res, slow_limit)
+                key = (kind, res.exit if res else None)
+                if kind is not None and key not in findings:
+                    findings[key] = FuzzFinding(kind, data, args, res, timeout)
+
+            for finding in findings.values():
+                finding.minimized = self._fuzz_minimize(pool, finding, slow_limit)
+                finding.save(cases_dir)
+                LOG.warning("[FUZZ] Finding: %s", finding)
+        return FuzzResult(len(inputs), list(findings.values()))
+
+    def _fuzz_exec(self, data: bytes, args: Optional[List[str]], timeout: int) -> Optional['CommandResult']:
+        try:
+            return self.execute(ExecParams(args=args, stdin=Content(binary=data), timeout=timeout))
+        except subprocess.TimeoutExpired:
+            return None
+
+    def _fuzz_minimize(self, pool: 'ThreadPoolExecutor', finding: 'FuzzFinding',
+                       slow_limit: Optional[float]) -> bytes:
+        executed = 0
+
+        def _reproduces(data: bytes) -> bool:
+            res = self._fuzz_exec(data, finding.args, finding.timeout)
+            return _fuzz_classify(res, slow_limit) == finding.kind and (res is None or res.exit == finding.exit)
+
+        def _first_reproducing(candidates: List[bytes]) -> Optional[int]:
+            # Limit the total number of the executions, each step costs at most a single timeout
+            nonlocal executed
+            candidates = candidates[:max(FUZZ_MINIMIZE_STEPS - executed, 0)]
+            executed += len(candidates)
+            return next((idx for idx, ok in enumerate(pool.map(_reproduces, candidates)) if ok), None)
+
+        return _ddmin(finding.data, _first_reproducing)
+
     @classmethod
     def _resolve_exec(cls, path: Path) -> Optional[Path]:
         """Hacky way to resolve windows executable (with exe suffix)
@@ -249,11 +463,13 @@ class Executable:
 
 
 class CommandResult:
-    def __init__(self, exit_code: int, stdout: Path, stderr: Path, elapsed: int):
+    def __init__(self, exit_code: int, stdout: Path, stderr: Path, elapsed: int,
+                 timeline: 'OutputTimeline' = None):
         self.exit: int = exit_code
         self.stdout: Path = stdout
         self.stderr: Path = stderr
         self.elapsed: int = elapsed
+        self.timeline: Optional[OutputTimeline] = timeline
 
     def out(self) -> Content:
         return Content(file=self.stdout)
@@ -273,6 +489,443 @@ class CommandResult:
         return str(self)
 
 
+class OutputEvent:
+    def __init__(self, elapsed: int, stream: str, size: int):
+        """Chunk of the output read from the executable
+        :param elapsed: Time since the execution start (ns)
+        :param stream: Stream name (stdout, stderr)
+        :param size: Chunk size in bytes
+        """
+        self.elapsed = elapsed
+        self.stream = stream
+        self.size = size
+
+    def __str__(self) -> str:
+        return f"{self.stream}[{self.size}]@{self.elapsed}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class OutputTimeline:
+    def __init__(self):
+        """Timestamps of the executable output (chunks and lines), all times are in ns
+        since the execution start
+        """
+        self.events: List[OutputEvent] = []
+        self.lines: Dict[str, List[int]] = {'stdout': [], 'stderr': []}
+        self._partial: Dict[str, Optional[int]] = {'stdout': None, 'stderr': None}
+
+    def record(self, stream: str, elapsed: int, chunk: bytes):
+        self.events.append(OutputEvent(elapsed, stream, len(chunk)))
+        self.lines[stream].extend([elapsed] * chunk.count(b'\n'))
+        self._partial[stream] = None if chunk.endswith(b'\n') else elapsed
+
+    def finish(self, stream: str):
+        # The last line without the newline
+        if self._partial[stream] is not None:
+            self.lines[stream].append(self._partial[stream])
+            self._partial[stream] = None
+
+    def stream_events(self, stream: str = None) -> List[OutputEvent]:
+        """Output events ordered by time
+        :param stream: Stream name (stdout, stderr), None for both streams
+        """
+        return sorted((e for e in self.events if stream is None or e.stream == stream), key=lambda e: e.elapsed)
+
+    def first_byte(self, stream: str = None) -> Optional[int]:
+        """Time to the first byte of the output
+        :param stream: Stream name (stdout, stderr), None for both streams
+        :return: None if there was no output
+        """
+        events = self.stream_events(stream)
+        return events[0].elapsed if events else None
+
+    def max_gap(self, stream: str = None) -> int:
+        """The longest time between two consecutive output chunks"""
+        times = [e.elapsed for e in self.stream_events(stream)]
+        return max((b - a for a, b in zip(times, times[1:])), default=0)
+
+    def assert_first_output(self, within_ms: float, stream: str = None) -> None:
+        """Asserts that the first output appeared within the time limit
+        :param within_ms: Time limit in milliseconds
+        :param stream: Stream name (stdout, stderr), None for both streams
+        """
+        first = self.first_byte(stream)
+        assert first is not None, f"No output ({stream or 'stdout, stderr'})"
+        assert first <= within_ms * 1e6, f"First output after {first / 1e6:.3f} ms (limit: {within_ms} ms)"
+
+    def assert_max_gap(self, within_ms: float, stream: str = None) -> None:
+        """Asserts that there is no longer pause between the output chunks than the limit"""
+        gap = self.max_gap(stream)
+        assert gap <= within_ms * 1e6, f"Output gap {gap / 1e6:.3f} ms (limit: {within_ms} ms)"
+
+    def __str__(self) -> str:
+        return str({
+            'first_byte': self.first_byte(),
+            'max_gap': self.max_gap(),
+            'lines': {stream: len(lines) for stream, lines in self.lines.items()},
+        })
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class DiffCase:
+    def __init__(self, params: 'ExecParams', reference: Optional['CommandResult'],
+                 candidate: Optional['CommandResult']):
+        """Single case of the differential execution
+        :param params: Execution parameters used for both executables
+        :param reference: Result of the reference executable, None if it timed out
+        :param candidate: Result of the candidate executable, None if it timed out
+        """
+        self.params = params
+        self.reference = reference
+        self.candidate = candidate
+        self.mismatches: List[str] = self._compare()
+
+    def _compare(self) -> List[str]:
+        if self.reference is None or self.candidate is None:
+            return ['timeout']
+        mismatches = []
+        if self.reference.exit != self.candidate.exit:
+            mismatches.append('exit')
+        if not stream_compare(self.reference.out(), self.candidate.out()):
+            mismatches.append('stdout')
+        if not stream_compare(self.reference.err(), self.candidate.err()):
+            mismatches.append('stderr')
+        return mismatches
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def timed(self) -> bool:
+        """Whether both executables finished (have the elapsed time)"""
+        return self.reference is not None and self.candidate is not None
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """Relative speedup of the candidate (> 1.0 is faster, < 1.0 is slower)
+        :return: None if any of the executables timed out
+        """
+        if not self.timed:
+            return None
+        return self.reference.elapsed / max(self.candidate.elapsed, 1)
+
+    def __str__(self) -> str:
+        return str({
+            'args': self.params.args,
+            'mismatches': self.mismatches,
+            'speedup': _round(self.speedup),
+            'reference': str(self.reference),
+            'candidate': str(self.candidate),
+        })
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class DiffResult:
+    def __init__(self, cases: List['DiffCase']):
+        self.cases: List[DiffCase] = cases
+
+    @property
+    def mismatches(self) -> List['DiffCase']:
+        return [case for case in self.cases if not case.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """Relative speedup of the candidate over all the cases where both executables finished
+        :return: None if there is no such case
+        """
+        timed = [case for case in self.cases if case.timed]
+        if not timed:
+            return None
+        ref = sum(case.reference.elapsed for case in timed)
+        cand = sum(case.candidate.elapsed for case in timed)
+        return ref / max(cand, 1)
+
+    def __str__(self) -> str:
+        return str({
+            'cases': len(self.cases),
+            'mismatches': len(self.mismatches),
+            'speedup': _round(self.speedup),
+        })
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class FindingKind(enum.Enum):
+    CRASH = 'crash'
+    TIMEOUT = 'timeout'
+    SLOW = 'slow'
+
+
+class FuzzFinding:
+    def __init__(self, kind: 'FindingKind', data: bytes, args: Optional[List[str]],
+                 result: Optional['CommandResult'], timeout: int):
+        """Input that crashed, timed out or was considerably slower than the others
+        :param kind: Kind of the finding
+        :param data: Original (not minimized) standard input
+        :param args: Executable arguments
+        :param result: Execution result, None if the execution timed out
+        :param timeout: Execution timeout in seconds
+        """
+        self.kind = kind
+        self.data = data
+        self.args = args or []
+        self.result = result
+        self.timeout = timeout
+        self.minimized: bytes = data
+        self.path: Optional[Path] = None
+
+    @property
+    def exit(self) -> Optional[int]:
+        return self.result.exit if self.result else None
+
+    def save(self, cases_dir: Path) -> Path:
+        """Stores the minimized input as a data-driven case
+        The case expects the finding to reproduce (the same exit code or a timeout).
+        Slow findings are marked as skipped, the elapsed time is not checked by the cases.
+        The case name is derived from the input digest, so concurrent fuzzing runs do not collide
+        :param cases_dir: Directory where the case is stored
+        :return: Location of the case standard input (``<name>.in``)
+        """
+        import hashlib  # pylint: disable=import-outside-toplevel
+        import json  # pylint: disable=import-outside-toplevel
+        cases_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{self.kind.value}_{hashlib.sha256(self.minimized).hexdigest()[:16]}"
+        self.path = cases_dir / f"{name}.in"
+        self.path.write_bytes(self.minimized)
+        meta = {
+            'args': self.args,
+            'exit': self.exit,
+            'timeout': self.timeout,
+            'finding': {
+                'kind': self.kind.value,
+                'exit': self.exit,
+                'elapsed': self.result.elapsed if self.result else None,
+            },
+        }
+        if self.kind == FindingKind.SLOW:
+            meta['skip'] = "slow finding, the elapsed time is not checked"
+        (cases_dir / f"{name}.json").write_text(json.dumps(meta, indent=2))
+        return self.path
+
+    def __str__(self) -> str:
+        return str({
+            'kind': self.kind.value,
+            'exit': self.exit,
+            'size': len(self.data),
+            'minimized': len(self.minimized),
+            'path': str(self.path),
+        })
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class FuzzResult:
+    def __init__(self, executions: int, findings: List['FuzzFinding']):
+        self.executions = executions
+        self.findings = findings
+
+    @property
+    def ok(self) -> bool:
+        return not self.findings
+
+    def __str__(self) -> str:
+        return str({
+            'executions': self.executions,
+            'findings': [str(finding) for finding in self.findings],
+        })
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Case:
+    def __init__(self, name: str, params: 'ExecParams', exe: Optional[str] = None, exit_code: Optional[int] = 0,
+                 stdout: Content = None, stderr: Content = None):
+        """Data-driven test case
+        :param name: Name of the case
+        :param params: Execution parameters (args, stdin, env)
+        :param exe: Executable used by the case (path), None for the default executable
+        :param exit_code: Expected exit code, None if the execution is expected to time out
+        :param stdout: Expected standard output, None if it should not be checked
+        :param stderr: Expected standard error output, None if it should not be checked
+        """
+        self.name = name
+        self.params = params
+        self.exe = exe
+        self.exit_code = exit_code
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any], base: Path) -> 'Case':
+        """Creates the case from the manifest/metadata definition
+        Files (stdin, stdout, stderr) and the executable (exe) are relative to the ``base``
+        """
+        def _file(key: str) -> Optional[Content]:
+            return Content(file=base / data[key]) if data.get(key) else None
+
+        stdin = _file('stdin') or (Content(text=data['text']) if 'text' in data else None)
+        other = {'timeout': data['timeout']} if 'timeout' in data else {}
+        params = ExecParams(args=data.get('args'), stdin=stdin, env=data.get('env'), **other)
+        return cls(
+            name=data.get('name', name),
+            params=params,
+            exe=str(base / data['exe']) if data.get('exe') else None,
+            exit_code=data.get('exit', 0),
+            stdout=_file('stdout'),
+            stderr=_file('stderr'),
+        )
+
+    def run(self, exe: 'Executable') -> 'CaseResult':
+        try:
+            res = exe.execute(self.params)
+        except subprocess.TimeoutExpired as ex:
+            return CaseResult(self, None, [] if self.exit_code is None else [type(ex).__name__])
+        except FileNotFoundError as ex:
+            return CaseResult(self, None, [type(ex).__name__])
+        failures = []
+        if res.exit != self.exit_code:
+            failures.append('exit')
+        if self.stdout is not None and not stream_compare(res.out(), self.stdout):
+            failures.append('stdout')
+        if self.stderr is not None and not stream_compare(res.err(), self.stderr):
+            failures.append('stderr')
+        if failures and exe.workspace is not None:
+            exe.workspace.persist(res)
+        return CaseResult(self, res, failures)
+
+    def __str__(self) -> str:
+        return f"Case({self.name})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class CaseResult:
+    def __init__(self, case: 'Case', result: Optional['CommandResult'], failures: List[str]):
+        self.case = case
+        self.result = result
+        self.failures = failures
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def __str__(self) -> str:
+        return str({
+            'case': self.case.name,
+            'failures': self.failures,
+            'result': str(self.result),
+        })
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Watcher:
+    def __init__(self, cases: List['Case'], ws_path: Path, sources: Path = None,
+                 exe: Union[Path, str] = None, build: bool = True):
+        """Rebuilds the sources on change and reruns cases of the changed executables
+        :param cases: Data-driven cases
+        :param ws_path: Workspace location (build and execution outputs)
+        :param sources: Watched sources location (default: current working directory)
+        :param exe: Default executable for the cases without ``exe``, relative to the sources
+        :param build: Whether to build the sources using cmake
+        """
+        missing = [case.name for case in cases if not case.exe]
+        if missing and exe is None:
+            raise ValueError(f"No executable for the cases (set the default executable): {', '.join(missing)}")
+        self.cases = cases
+        self.sources = Path(sources) if sources else Path.cwd()
+        self.workspace = Workspace(ws_path)
+        self.exe = exe
+        self.build = build
+        self.failing: set = set()
+        self._snapshot: Optional[Dict[Path, Any]] = None
+        self._hashes: Dict[str, str] = {}
+
+    def cycle(self) -> Optional[List['CaseResult']]:
+        """Single watch iteration
+        :return: None if the sources did not change, otherwise results of the rerun cases
+        """
+        snapshot = self._sources_snapshot()
+        if snapshot == self._snapshot:
+            return None
+        self._snapshot = snapshot
+        if self.build:
+            try:
+                build_using_cmake(self.workspace.ws_path, self.sources)
+            except RuntimeError as ex:
+                LOG.error("[WATCH] Build failed: %s", ex)
+                return []
+        changed = self._changed_executables()
+        cases = [case for case in self.cases if self._case_exe(case) in changed]
+        # Previously failing cases first
+        cases.sort(key=lambda case: case.name not in self.failing)
+        LOG.info("[WATCH] Changed executables: %s, rerunning %d cases", sorted(changed), len(cases))
+        results = []
+        for case in cases:
+            res = case.run(Executable(self.sources / self._case_exe(case), workspace=self.workspace))
+            if res.ok:
+                self.failing.discard(case.name)
+            else:
+                self.failing.add(case.name)
+            results.append(res)
+        return results
+
+    def watch(self, interval: float = 1.0, cycles: int = None):
+        for _ in (itertools.count() if cycles is None else range(cycles)):
+            results = self.cycle()
+            if results is not None:
+                print_summary(results)
+            time.sleep(interval)
+
+    def _case_exe(self, case: 'Case') -> str:
+        return str(case.exe or self.exe)
+
+    def _changed_executables(self) -> set:
+        changed = set()
+        for exe in {self._case_exe(case) for case in self.cases}:
+            path = Executable(self.sources / exe).exe
+            digest = file_digest(path) if path.exists() else None
+            if self._hashes.get(exe, '') != digest:
+                changed.add(exe)
+            self._hashes[exe] = digest
+        return changed
+
+    def _sources_snapshot(self) -> Dict[Path, Any]:
+        snapshot = {}
+        ws_path = Path(self.workspace.ws_path).resolve()
+        for root, dirs, files in os.walk(self.sources):
+            # Execution outputs stored in the workspace are not sources
+            dirs[:] = [d for d in dirs if d not in WATCH_IGNORE and not d.startswith('.')
+                       and (Path(root) / d).resolve() != ws_path]
+            for name in files:
+                if name.startswith('.'):
+                    continue
+                path = Path(root) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    # Dangling symlink or a file removed in the meantime (editor temp files)
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
 def build_using_cmake(ws_path: Path, sources: Path = None):
     """Build the solution using cmake
     :param sources:
@@ -299,19 +952,220 @@ def _build_exec(ws: Workspace, cmd: str, args: List[str]):
 
 # Utils
 
+_EXEC_SEQ = itertools.count()
+
+
+def stream_compare(first: Content, second: Content, chunk_size: int = STREAM_CHUNK_SIZE) -> bool:
+    """Compares two contents chunk by chunk
+    File contents are not loaded into the memory as a whole
+    :param first: First content
+    :param second: Second content
+    :param chunk_size: Size of the compared chunks
+    :return: true if the contents are the same
+    """
+    if first.file is None or second.file is None:
+        return (first.binary() or b'') == (second.binary() or b'')
+    if first.size() != second.size():
+        return False
+    with first.file.open('rb') as fd_first, second.file.open('rb') as fd_second:
+        while True:
+            chunk = fd_first.read(chunk_size)
+            if chunk != fd_second.read(chunk_size):
+                return False
+            if not chunk:
+                return True
+
+
+def file_digest(path: Path) -> str:
+    """Computes the sha256 digest of the file content"""
+    import hashlib  # pylint: disable=import-outside-toplevel
+    digest = hashlib.sha256()
+    with path.open('rb') as fd:
+        for chunk in iter(lambda: fd.read(STREAM_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cases(path: Path) -> List[Case]:
+    """Loads data-driven cases
+    The path is either a manifest (json file with a list of cases)
+    or a directory where each case is defined by files with the same name:
+    ``<name>.in`` (stdin), ``<name>.out`` (stdout), ``<name>.err`` (stderr)
+    and ``<name>.json`` (args, env, exit, exe, timeout, skip);
+    the ``exit: null`` means that the execution is expected to time out
+    :param path: Location of the manifest or the cases directory
+    :return: List of the cases
+    """
+    import json  # pylint: disable=import-outside-toplevel
+    path = Path(path)
+    if path.is_file():
+        manifest = json.loads(path.read_text())
+        manifest = manifest['cases'] if isinstance(manifest, dict) else manifest
+        return [Case.from_dict(f"case_{idx:04d}", data, path.parent) for idx, data in enumerate(manifest)]
+    cases = []
+    for name in sorted({p.stem for p in path.iterdir() if p.suffix in ('.in', '.json')}):
+        meta = path / f"{name}.json"
+        data = json.loads(meta.read_text()) if meta.exists() else {}
+        if data.get('skip'):
+            LOG.info("[CASES] Skipping case %s: %s", name, data['skip'])
+            continue
+        for key, suffix in (('stdin', '.in'), ('stdout', '.out'), ('stderr', '.err')):
+            if key not in data and (path / f"{name}{suffix}").exists():
+                data[key] = f"{name}{suffix}"
+        cases.append(Case.from_dict(name, data, path))
+    return cases
+
+
+def run_cases(cases: List[Case], exe: Union[Path, str] = None, workspace: Workspace = None,
+              jobs: int = 1, fail_fast: bool = False) -> List[CaseResult]:
+    """Runs the data-driven cases in parallel
+    :param cases: Cases to run
+    :param exe: Default executable for the cases without ``exe``
+    :param workspace: Workspace where the outputs are stored
+    :param jobs: Max. number of parallel executions
+    :param fail_fast: Do not start new cases after the first failure
+    :return: Results of the finished cases (in the order of the cases)
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed  # pylint: disable=import-outside-toplevel
+    results: Dict[int, CaseResult] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(case.run, Executable(case.exe or exe, workspace=workspace)): idx
+            for idx, case in enumerate(cases)
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            res = future.result()
+            results[futures[future]] = res
+            if fail_fast and not res.ok:
+                LOG.info("[RUN] Case %s failed, cancelling the remaining cases", res.case.name)
+                for pending in futures:
+                    pending.cancel()
+    return [results[idx] for idx in sorted(results)]
+
+
+def shard_cases(cases: List[Case], shard: str) -> List[Case]:
+    """Selects the cases of the shard
+    :param cases: All the cases
+    :param shard: Shard in format ``i/n`` (1-based), for example ``2/4``
+    :return: Every n-th case starting with the i-th
+    """
+    index, count = parse_shard(shard)
+    return cases[index - 1::count]
+
+
+def parse_shard(shard: str) -> Tuple[int, int]:
+    """Parses the shard definition
+    :param shard: Shard in format ``i/n`` (1-based), for example ``2/4``
+    :return: Tuple of the shard index and the shards count
+    """
+    try:
+        index, count = (int(part) for part in shard.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard (expected format i/n): {shard}") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard (expected 1 <= i <= n): {shard}")
+    return index, count
+
+
+def print_summary(results: List[CaseResult], elapsed: int = None, slowest: int = 5):
+    """Prints the failed cases, the totals, and optionally the throughput and the slowest cases
+    :param results: Case results
+    :param elapsed: Wall-clock time of the run in nanoseconds
+    :param slowest: Number of the slowest cases to print
+    """
+    for res in results:
+        if not res.ok:
+            print(f"FAIL {res.case.name}: {', '.join(res.failures)}")
+    failed = sum(1 for res in results if not res.ok)
+    print(f"{len(results) - failed} passed, {failed} failed")
+    if elapsed is None:
+        return
+    print(f"{len(results) / max(elapsed / 1e9, 1e-9):.2f} cases/s ({elapsed / 1e9:.3f} s)")
+    timed = sorted((res for res in results if res.result), key=lambda res: res.result.elapsed, reverse=True)
+    for res in timed[:slowest]:
+        print(f"  {res.result.elapsed / 1e6:10.3f} ms  {res.case.name}")
+
+
+def _diff_exec(exe: Executable, params: ExecParams) -> Optional[CommandResult]:
+    try:
+        return exe.execute(params)
+    except subprocess.TimeoutExpired:
+        LOG.warning("[DIFF] Execution of \"%s\" timed out", exe.exe)
+        return None
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+def _mutate(data: bytes, rng: 'random.Random') -> bytes:
+    buf = bytearray(data)
+    op = rng.randrange(5) if buf else 0
+    pos = rng.randrange(len(buf) + 1)
+    if op == 0:  # insert random bytes
+        buf[pos:pos] = bytes(rng.randrange(256) for _ in range(rng.randint(1, 16)))
+    elif op == 1:  # flip a bit
+        pos = min(pos, len(buf) - 1)
+        buf[pos] ^= 1 << rng.randrange(8)
+    elif op == 2:  # delete a chunk
+        del buf[pos:pos + rng.randint(1, 16)]
+    elif op == 3:  # duplicate a chunk
+        buf[pos:pos] = buf[pos:pos + rng.randint(1, 64)] * rng.randint(2, 32)
+    else:  # replace a byte with an interesting value
+        pos = min(pos, len(buf) - 1)
+        buf[pos] = rng.choice((0x00, 0x0a, 0x20, 0x2d, 0x30, 0x39, 0x7f, 0xff))
+    return bytes(buf)
+
+
+def _fuzz_classify(res: Optional[CommandResult], slow_limit: Optional[float]) -> Optional[FindingKind]:
+    if res is None:
+        return FindingKind.TIMEOUT
+    if res.exit < 0:
+        return FindingKind.CRASH
+    if slow_limit is not None and res.elapsed > slow_limit:
+        return FindingKind.SLOW
+    return None
+
+
+def _ddmin(data: bytes, first_reproducing) -> bytes:
+    """Delta debugging - removes chunks of the input while the failure still reproduces
+    :param data: Input that reproduces the failure
+    :param first_reproducing: Returns index of the first candidate input that reproduces the failure
+        (or None), all the candidates of a step can be tested in parallel
+    """
+    parts = 2
+    while len(data) >= 2:
+        size = -(-len(data) // parts)
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        complements = [b''.join(chunks[:idx] + chunks[idx + 1:]) for idx in range(len(chunks))]
+        idx = first_reproducing(complements)
+        if idx is not None:
+            data = complements[idx]
+            parts = max(parts - 1, 2)
+        else:
+            if parts >= len(data):
+                break
+            parts = min(parts * 2, len(data))
+    return data
+
 
 def execute_cmd(cmd: str, args: List[str], ws: Path, stdin: Content = None,
                 stdout: Path = None, stderr: Path = None, nm: str = None,
                 log: logging.Logger = None, timeout: int = 60, cmd_prefix: List[str] = None,
-                env: Dict[str, Any] = None, cwd: Union[str, Path] = None,
+                env: Dict[str, Any] = None, cwd: Union[str, Path] = None, timeline: bool = False,
                 **kwargs) -> 'CommandResult':
+    """Executes the command and stores its outputs to the workspace
+    When the ``timeline`` is enabled, the outputs are read through pipes
+    and the time of each chunk/line is recorded (see ``OutputTimeline``)
+    """
     # pylint: disable=R0914,R0913
     log = log or LOG
     log.info("[CMD] Exec: '%s' with args %s", cmd, str(args))
     log.debug(" -> [CMD] Exec STDIN: '%s'", stdin if stdin else "EMPTY")
     log.trace(" -> [CMD] Exec with timeout %d, cwd: '%s'", timeout, cwd)
-    if not nm:
-        nm = cmd.split('/')[-1] + "_" + datetime.datetime.now().isoformat("_").replace(':', '-')
+    nm = nm or _exec_name(cmd)
     stdout = stdout or ws / f'{nm}.stdout'
     stderr = stderr or ws / f'{nm}.stderr'
 
@@ -320,21 +1174,37 @@ def execute_cmd(cmd: str, args: List[str], ws: Path, stdin: Content = None,
     with stdout.open('w') as fd_out, stderr.open('w') as fd_err:
         fd_in = Path(stdin.file).open('r') if stdin and stdin.file else None
         _input = stdin.binary() if fd_in is None and stdin else None
+        output_timeline = OutputTimeline() if timeline else None
         start_time = time.perf_counter_ns()
         try:
             cmd_prefix = cmd_prefix if cmd_prefix else []
-            exec_result = subprocess.run(
-                [*cmd_prefix, cmd, *args],
-                stdout=fd_out,
-                stderr=fd_err,
-                stdin=fd_in,
-                input=_input,
-                timeout=timeout,
-                env=full_env,
-                check=False,
-                cwd=str(cwd) if cwd else None,
-                **kwargs
-            )
+            if output_timeline is not None:
+                exec_result = _run_with_timeline(
+                    [*cmd_prefix, cmd, *args],
+                    fd_out=fd_out,
+                    fd_err=fd_err,
+                    fd_in=fd_in,
+                    _input=_input,
+                    timeout=timeout,
+                    timeline=output_timeline,
+                    start_time=start_time,
+                    env=full_env,
+                    cwd=str(cwd) if cwd else None,
+                    **kwargs
+                )
+            else:
+                exec_result = subprocess.run(
+                    [*cmd_prefix, cmd, *args],
+                    stdout=fd_out,
+                    stderr=fd_err,
+                    stdin=fd_in,
+                    input=_input,
+                    timeout=timeout,
+                    env=full_env,
+                    check=False,
+                    cwd=str(cwd) if cwd else None,
+                    **kwargs
+                )
         except Exception as ex:
             log.error("[CMD] Execution '%s' failed: %s", cmd, ex)
             raise ex
@@ -354,10 +1224,85 @@ def execute_cmd(cmd: str, args: List[str], ws: Path, stdin: Content = None,
         elapsed=end_time - start_time,
         stdout=stdout,
         stderr=stderr,
+        timeline=output_timeline,
     )
 
 
+def _exec_name(cmd: str) -> str:
+    """Unique name of the execution outputs"""
+    timestamp = datetime.datetime.now().isoformat("_").replace(':', '-')
+    return f"{cmd.split('/')[-1]}_{timestamp}_{next(_EXEC_SEQ)}"
+
+
+def _run_with_timeline(argv: List[str], fd_out, fd_err, fd_in, _input: Optional[bytes], timeout: int,
+                       timeline: OutputTimeline, start_time: int, **kwargs) -> subprocess.CompletedProcess:
+    # pylint: disable=R0913
+    def _capture(pipe, sink, stream: str):
+        while True:
+            chunk = os.read(pipe.fileno(), STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            timeline.record(stream, time.perf_counter_ns() - start_time, chunk)
+            try:
+                sink.write(chunk)
+            except ValueError:
+                # The output file was closed - the capture was abandoned
+                return
+        sink.flush()
+        timeline.finish(stream)
+
+    def _kill():
+        try:
+            if kwargs['start_new_session']:
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except ProcessLookupError:
+            pass
+
+    def _feed(pipe):
+        try:
+            pipe.write(_input)
+        except BrokenPipeError:
+            pass
+        finally:
+            pipe.close()
+
+    stdin = subprocess.PIPE if _input is not None else fd_in
+    # Own process group - grandchildren holding the pipes are killed on timeout as well
+    kwargs.setdefault('start_new_session', hasattr(os, 'killpg'))
+    with subprocess.Popen(argv, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs) as proc:
+        threads = [
+            threading.Thread(target=_capture, args=(proc.stdout, fd_out.buffer, 'stdout'), daemon=True),
+            threading.Thread(target=_capture, args=(proc.stderr, fd_err.buffer, 'stderr'), daemon=True),
+        ]
+        if _input is not None:
+            threads.append(threading.Thread(target=_feed, args=(proc.stdin,), daemon=True))
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill()
+            # Do not wait for the processes that escaped the process group
+            for thread in threads:
+                thread.join(TIMELINE_KILL_GRACE)
+            raise
+        # Background grandchildren can hold the pipes after the command exited
+        for thread in threads:
+            remaining = TIMELINE_KILL_GRACE if deadline is None else deadline - time.monotonic()
+            thread.join(max(min(remaining, TIMELINE_KILL_GRACE), 0))
+        if any(thread.is_alive() for thread in threads):
+            LOG.warning("[CMD] Killing background processes holding the output of: %s", argv)
+            _kill()
+            for thread in threads:
+                thread.join(TIMELINE_KILL_GRACE)
+    return subprocess.CompletedProcess(argv, proc.returncode)
+
+
 def obj_get_props_dict(obj: object) -> Dict[str, Any]:
+    import inspect  # pylint: disable=import-outside-toplevel
     cls = obj.__class__
     props = inspect.getmembers(cls, lambda o: isinstance(o, property))
     res = {}
@@ -388,6 +1333,7 @@ def dict_serialize(obj, as_dict_skip: bool = False) -> Any:
 
 
 def load_logger(level: str = None, log_file: Optional[Path] = None, file_level: str = None):
+    import logging.config  # pylint: disable=import-outside-toplevel
     level = level if level else os.getenv("LOG_LEVEL", "info")
     level = level.upper()
     file_level = file_level.upper() if file_level else level
@@ -425,3 +1371,83 @@ def load_logger(level: str = None, log_file: Optional[Path] = None, file_level:
         }
         log_config['loggers'][NAME]['handlers'].append('file')
     logging.config.dictConfig(log_config)
+
+
+# CLI
+
+def main(argv: List[str] = None) -> int:
+    # pylint: disable=R0914
+    import argparse  # pylint: disable=import-outside-toplevel
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    def _positive_int(value: str) -> int:
+        if not value.isdigit() or int(value) < 1:
+            raise argparse.ArgumentTypeError(f"expected a positive integer: {value}")
+        return int(value)
+
+    def _shard(value: str) -> str:
+        try:
+            parse_shard(value)
+        except ValueError as ex:
+            raise argparse.ArgumentTypeError(str(ex)) from None
+        return value
+
+    parser = argparse.ArgumentParser(prog=NAME, description="Simple IO testing helper")
+    parser.add_argument('--log-level', default=None, help="Logging level (default: only warnings are printed)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Run data-driven cases")
+    run.add_argument('exe', help="Executable used by the cases without exe")
+    run.add_argument('cases', type=Path, help="Cases directory or manifest")
+    run.add_argument('-j', '--jobs', type=_positive_int, default=1, help="Number of parallel executions")
+    run.add_argument('--shard', type=_shard, default=None,
+                     help="Run only the i-th of n shards (format: i/n, 1-based)")
+    run.add_argument('--fail-fast', action='store_true', help="Stop after the first failure")
+    run.add_argument('--ws', type=Path, default=None,
+                     help="Workspace location (default: temporary directory, removed on success)")
+    run.add_argument('--slowest', type=_positive_int, default=5, help="Number of the slowest cases in the summary")
+
+    watch = commands.add_parser('watch', help="Rebuild on source change and rerun cases of the changed executables")
+    watch.add_argument('cases', type=Path, help="Cases directory or manifest")
+    watch.add_argument('--exe', help="Default executable (relative to the sources)")
+    watch.add_argument('--sources', type=Path, default=Path.cwd(), help="Watched sources (default: cwd)")
+    watch.add_argument('--ws', type=Path, default=None, help="Workspace location (default: temporary directory)")
+    watch.add_argument('--interval', type=float, default=1.0, help="Polling interval in seconds")
+    watch.add_argument('--no-build', dest='build', action='store_false', help="Do not build using cmake")
+
+    args = parser.parse_args(argv)
+    if not args.cases.exists():
+        parser.error(f"cases not found: {args.cases}")
+    if args.log_level:
+        load_logger(args.log_level)
+    ws_path = args.ws or Path(tempfile.mkdtemp(prefix=f"{NAME}_"))
+    ws_path.mkdir(parents=True, exist_ok=True)
+    if args.command == 'run':
+        cases = load_cases(args.cases)
+        cases = shard_cases(cases, args.shard) if args.shard else cases
+        start_time = time.perf_counter_ns()
+        results = run_cases(cases, args.exe, Workspace(ws_path), jobs=args.jobs, fail_fast=args.fail_fast)
+        print_summary(results, time.perf_counter_ns() - start_time, args.slowest)
+        if all(res.ok for res in results) and len(results) == len(cases):
+            if args.ws is None:
+                shutil.rmtree(ws_path, ignore_errors=True)
+            return 0
+        print(f"Outputs are stored in: {ws_path}")
+        return 1
+    if args.command == 'watch':
+        try:
+            watcher = Watcher(load_cases(args.cases), ws_path, args.sources, exe=args.exe, build=args.build)
+        except ValueError as ex:
+            if args.ws is None:
+                shutil.rmtree(ws_path, ignore_errors=True)
+            parser.error(str(ex))
+        print(f"Outputs are stored in: {ws_path}")
+        try:
+            watcher.watch(args.interval)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,6 @@
+import sys
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
@@ -23,3 +25,14 @@ def workspace(tmp_path: Path) -> siot.Workspace:
 @pytest.fixture(scope='session')
 def examples() -> Path:
     return ROOT_DIR / 'examples'
+
+
+@pytest.fixture()
+def script() -> Callable[[Path, str], Path]:
+    # Helper - creates an executable python script with the given code
+    def _script(path: Path, code: str) -> Path:
+        path.write_text(f"#! {sys.executable}\n{code}\n")
+        path.chmod(0o755)
+        return path
+
+    return _script
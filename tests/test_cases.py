@@ -0,0 +1,163 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import siot
+from siot import Watcher, load_cases
+
+
+def _cases(path: Path) -> Path:
+    path.mkdir()
+    (path / 'upper.in').write_text('hello')
+    (path / 'upper.out').write_text('HELLO')
+    (path / 'upper.json').write_text(json.dumps({'exe': '../upper.py'}))
+    (path / 'echo.json').write_text(json.dumps({'args': ['hi'], 'exe': '../echo.py'}))
+    (path / 'echo.out').write_text('hi\n')
+    return path
+
+
+def test_load_cases_directory(tmp_path: Path):
+    cases = load_cases(_cases(tmp_path / 'cases'))
+    assert [case.name for case in cases] == ['echo', 'upper']
+    assert cases[0].params.args == ['hi']
+    assert cases[1].params.stdin.text() == 'hello'
+    assert cases[1].stdout.text() == 'HELLO'
+
+
+def test_load_cases_manifest(tmp_path: Path):
+    manifest = tmp_path / 'cases.json'
+    manifest.write_text(json.dumps({'cases': [{'name': 'first', 'text': 'x', 'exit': 2}]}))
+    cases = load_cases(manifest)
+    assert cases[0].name == 'first'
+    assert cases[0].exit_code == 2
+    assert cases[0].params.stdin.text() == 'x'
+
+
+def test_watch_reruns_changed_executables(tmp_path: Path, script):
+    src = tmp_path / 'src'
+    src.mkdir()
+    ws = tmp_path / 'ws'
+    ws.mkdir()
+    script(src / 'upper.py', 'import sys; print(sys.stdin.read().upper(), end="")')
+    script(src / 'echo.py', 'import sys; print(sys.argv[1].upper())')
+    watcher = Watcher(load_cases(_cases(src / 'cases')), ws, src, build=False)
+
+    results = watcher.cycle()
+    assert {res.case.name: res.ok for res in results} == {'echo': False, 'upper': True}
+    assert watcher.cycle() is None
+
+    script(src / 'echo.py', 'import sys; print(sys.argv[1])')
+    results = watcher.cycle()
+    assert [(res.case.name, res.ok) for res in results] == [('echo', True)]
+    assert not watcher.failing
+
+
+def test_run_cases_with_jobs_and_shards(tmp_path: Path, capsys, script):
+    exe = script(tmp_path / 'upper.py', 'import sys; print(sys.stdin.read().upper(), end="")')
+    manifest = tmp_path / 'cases.json'
+    manifest.write_text(json.dumps([{'name': f'case_{i}', 'text': str(i)} for i in range(6)]))
+
+    assert siot.main(['run', str(exe), str(manifest), '--jobs', '3', '--shard', '2/3', '--ws', str(tmp_path)]) == 0
+    out = capsys.readouterr().out
+    assert '2 passed, 0 failed' in out
+    assert 'cases/s' in out
+    assert siot.shard_cases(load_cases(manifest), '2/3')[1].name == 'case_4'
+
+
+def test_run_cases_fail_fast(tmp_path: Path, capsys, script):
+    exe = script(tmp_path / 'fail.py', 'exit(1)')
+    manifest = tmp_path / 'cases.json'
+    manifest.write_text(json.dumps([{'name': f'case_{i}'} for i in range(20)]))
+
+    assert siot.main(['run', str(exe), str(manifest), '--fail-fast', '--ws', str(tmp_path)]) == 1
+    assert 'FAIL case_0: exit' in capsys.readouterr().out
+
+
+def test_watch_rebuilds_with_workspace_in_sources(tmp_path: Path):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'CMakeLists.txt').write_text(
+        'cmake_minimum_required(VERSION 3.0)\nproject(hello C)\nadd_executable(hello hello.c)\n'
+    )
+    (src / 'hello.c').write_text('#include <stdio.h>\nint main(void) { puts("Hello"); return 0; }\n')
+    cases = src / 'cases'
+    cases.mkdir()
+    (cases / 'hello.json').write_text(json.dumps({}))
+    (cases / 'hello.out').write_text('Hello world\n')
+    ws = src / 'ws'
+    ws.mkdir()
+    watcher = Watcher(load_cases(cases), ws, src, exe='build/hello')
+
+    assert [res.ok for res in watcher.cycle()] == [False]
+    assert watcher.cycle() is None
+
+    (src / 'hello.c').write_text('#include <stdio.h>\nint main(void) { puts("Hello world"); return 0; }\n')
+    assert [res.ok for res in watcher.cycle()] == [True]
+    assert watcher.cycle() is None
+
+
+@pytest.mark.parametrize('args', [['--shard', '2/0'], ['--shard', 'x'], ['--jobs', '0'], ['--slowest', '-1']])
+def test_run_invalid_arguments(tmp_path: Path, capsys, args):
+    with pytest.raises(SystemExit) as ex:
+        siot.main(['run', 'exe', str(tmp_path), *args])
+    assert ex.value.code == 2
+    assert 'usage:' in capsys.readouterr().err
+
+
+def test_run_removes_temporary_workspace_on_success(tmp_path: Path, capsys, script, monkeypatch):
+    exe = script(tmp_path / 'ok.py', 'print("ok")')
+    manifest = tmp_path / 'cases.json'
+    manifest.write_text(json.dumps([{'name': 'ok'}]))
+    temp = tmp_path / 'temp'
+    temp.mkdir()
+    monkeypatch.setenv('TMPDIR', str(temp))
+    monkeypatch.setattr(tempfile, 'tempdir', None)
+
+    assert siot.main(['run', str(exe), str(manifest)]) == 0
+    assert not any(temp.iterdir())
+    exe.write_text(f"#! {sys.executable}\nexit(1)\n")
+    assert siot.main(['run', str(exe), str(manifest)]) == 1
+    assert f"Outputs are stored in: {next(temp.iterdir())}" in capsys.readouterr().out
+
+
+def test_watch_ignores_dangling_symlinks_and_dot_files(tmp_path: Path, script):
+    src = tmp_path / 'src'
+    src.mkdir()
+    script(src / 'upper.py', 'import sys; print(sys.stdin.read().upper(), end="")')
+    (src / 'dangling').symlink_to(src / 'missing')
+    watcher = Watcher(load_cases(_cases(src / 'cases')), tmp_path, src, exe='echo.py', build=False)
+    assert watcher.cycle() is not None
+
+    (src / '.upper.py.swp').write_text('swap')
+    assert watcher.cycle() is None
+
+
+def test_watch_requires_default_executable(tmp_path: Path, capsys):
+    cases = tmp_path / 'cases'
+    cases.mkdir()
+    (cases / 'first.in').write_text('x')
+    with pytest.raises(ValueError):
+        Watcher(load_cases(cases), tmp_path, tmp_path, build=False)
+    with pytest.raises(SystemExit) as ex:
+        siot.main(['watch', str(cases), '--ws', str(tmp_path)])
+    assert ex.value.code == 2
+
+
+def test_run_missing_cases(tmp_path: Path, capsys):
+    with pytest.raises(SystemExit) as ex:
+        siot.main(['run', 'exe', str(tmp_path / 'missing.json')])
+    assert ex.value.code == 2
+    assert 'cases not found' in capsys.readouterr().err
+
+
+def test_run_resolves_case_exe_against_manifest(tmp_path: Path, capsys, script):
+    sub = tmp_path / 'sub'
+    sub.mkdir()
+    exe = script(sub / 'echo.py', 'print("x")')
+    manifest = sub / 'cases.json'
+    manifest.write_text(json.dumps([{'name': 'x', 'exe': 'echo.py', 'text': ''}]))
+    assert load_cases(manifest)[0].exe == str(exe)
+    assert siot.main(['run', 'missing', str(manifest), '--ws', str(tmp_path)]) == 0
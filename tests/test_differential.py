@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from siot import Content, ExecParams, Workspace, stream_compare
+
+
+def test_differential_same_outputs(workspace: Workspace, tmp_path: Path, script):
+    ref = script(tmp_path / 'ref.py', 'import sys; print(sys.argv[1:])')
+    cand = script(tmp_path / 'cand.py', 'import sys; print(sys.argv[1:])')
+    cases = [ExecParams(args=['a']), ExecParams(args=['b', 'c'])]
+    res = workspace.differential(ref, cand, cases)
+    assert res.ok
+    assert len(res.cases) == 2
+    assert res.speedup > 0
+
+
+def test_differential_reports_mismatches(workspace: Workspace, tmp_path: Path, script):
+    ref = script(tmp_path / 'ref.py', 'import sys; print(sys.stdin.read())')
+    cand = script(tmp_path / 'cand.py', 'import sys; print(sys.stdin.read().upper()); exit(1)')
+    res = workspace.differential(ref, cand, [ExecParams(text='hello'), ExecParams(text='')])
+    assert not res.ok
+    assert res.mismatches[0].mismatches == ['exit', 'stdout']
+    assert res.cases[1].mismatches == ['exit']
+
+
+def test_stream_compare(tmp_path: Path):
+    first = tmp_path / 'first'
+    second = tmp_path / 'second'
+    first.write_bytes(b'x' * 1000)
+    second.write_bytes(b'x' * 999 + b'y')
+    assert stream_compare(Content(file=first), Content(file=first), chunk_size=64)
+    assert not stream_compare(Content(file=first), Content(file=second), chunk_size=64)
+    assert stream_compare(Content(file=first), Content(text='x' * 1000))
+
+
+def test_differential_reports_timeout(workspace: Workspace, tmp_path: Path, script):
+    ref = script(tmp_path / 'ref.py', 'print("x")')
+    cand = script(tmp_path / 'cand.py', 'import time; time.sleep(5)')
+    res = workspace.differential(ref, cand, [ExecParams(timeout=1)])
+    assert res.cases[0].mismatches == ['timeout']
+    assert res.cases[0].speedup is None
+    assert res.speedup is None
+    assert 'timeout' in str(res.cases[0])
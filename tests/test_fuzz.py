@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+
+from siot import Content, FindingKind, Workspace, load_cases
+
+CRASHER = '''
+import os, sys
+data = sys.stdin.buffer.read()
+if b'X' in data:
+    os.abort()
+sys.stdout.buffer.write(data)
+'''
+
+
+def test_fuzz_finds_and_minimizes_crash(workspace: Workspace, tmp_path: Path, script):
+    exe = workspace.executable(script(tmp_path / 'crasher.py', CRASHER))
+    res = exe.fuzz([Content(text='hello X world')], iterations=5, seed=42, slow_factor=1000)
+    crashes = [f for f in res.findings if f.kind == FindingKind.CRASH]
+    assert crashes
+    assert crashes[0].minimized == b'X'
+    assert crashes[0].path.read_bytes() == b'X'
+    meta = json.loads(crashes[0].path.with_suffix('.json').read_text())
+    assert meta['finding']['kind'] == 'crash'
+    assert meta['finding']['exit'] < 0
+
+
+def test_fuzz_without_findings(workspace: Workspace, tmp_path: Path, script):
+    exe = workspace.executable(script(tmp_path / 'cat.py', 'import sys; print(sys.stdin.read())'))
+    res = exe.fuzz([Content(text='abc')], iterations=5, seed=1, slow_factor=1000)
+    assert res.ok
+    assert res.executions == 6
+
+
+def test_fuzz_finding_reproduces_as_case(workspace: Workspace, tmp_path: Path, script):
+    exe = workspace.executable(script(tmp_path / 'crasher.py', CRASHER))
+    exe.fuzz([Content(text='aXb')], iterations=0, slow_factor=1000, cases_dir=tmp_path / 'cases')
+    cases = load_cases(tmp_path / 'cases')
+    assert len(cases) == 1
+    assert cases[0].exit_code < 0
+    assert cases[0].run(exe).ok
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from siot import Workspace
+
+PRODUCER = '''
+import sys, time
+print("first", flush=True)
+time.sleep(0.2)
+print("second", flush=True)
+sys.stderr.write("err")
+'''
+
+
+def test_timeline_records_output_times(workspace: Workspace):
+    res = workspace.execute(sys.executable, args=['-c', PRODUCER], timeline=True)
+
+    assert res.exit == 0
+    assert res.out().text() == 'first\nsecond\n'
+    assert res.err().text() == 'err'
+    tl = res.timeline
+    assert len(tl.lines['stdout']) == 2
+    assert len(tl.lines['stderr']) == 1
+    assert tl.lines['stdout'][1] - tl.lines['stdout'][0] >= 150e6
+    assert tl.first_byte('stdout') <= tl.first_byte('stderr')
+    tl.assert_first_output(within_ms=10_000)
+    assert tl.max_gap('stdout') >= 150e6
+
+
+def test_timeline_with_stdin(workspace: Workspace):
+    res = workspace.execute(sys.executable, args=['-c', 'import sys; print(sys.stdin.read())'],
+                            text='hello', timeline=True)
+    assert res.out().text() == 'hello\n'
+    assert res.timeline.first_byte() is not None
+
+
+def test_timeline_disabled_by_default(workspace: Workspace):
+    res = workspace.execute(sys.executable, args=['-c', 'print(1)'])
+    assert res.timeline is None
+
+
+def test_timeline_timeout_kills_grandchild(workspace: Workspace):
+    start = time.perf_counter()
+    with pytest.raises(subprocess.TimeoutExpired):
+        workspace.execute('sh', args=['-c', 'sleep 8; echo x'], timeout=1, timeline=True)
+    assert time.perf_counter() - start < 5
+
+
+def test_timeline_does_not_wait_for_background_grandchild(workspace: Workspace):
+    start = time.perf_counter()
+    res = workspace.execute('sh', args=['-c', 'sleep 6 & echo hi'], timeout=1, timeline=True)
+    assert time.perf_counter() - start < 3
+    assert res.exit == 0
+    assert res.out().text() == 'hi\n'
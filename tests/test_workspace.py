@@ -0,0 +1,75 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from siot import Workspace
+
+
+def _py(code: str):
+    return ['-c', code]
+
+
+def test_ram_workspace_stores_outputs_in_ram(tmp_path: Path):
+    ram = tmp_path / 'ram'
+    ram.mkdir()
+    with Workspace(tmp_path, ram_path=ram) as ws:
+        res = ws.execute(sys.executable, args=_py('print("hello")'))
+        assert res.stdout.parent.parent == ram
+        assert res.out().text() == 'hello\n'
+    assert not any(ram.iterdir())
+
+
+def test_ram_workspace_persists_failed_runs(tmp_path: Path):
+    ram = tmp_path / 'ram'
+    ram.mkdir()
+    with Workspace(tmp_path, ram_path=ram) as ws:
+        ok = ws.execute(sys.executable, args=_py('print("ok")'))
+        failed = ws.execute(sys.executable, args=_py('print("fail"); exit(3)'))
+    assert failed.exit == 3
+    assert failed.stdout.parent == tmp_path
+    assert failed.out().text() == 'fail\n'
+    assert ok.out().is_empty()
+
+
+def test_ram_workspace_falls_back_to_disk(tmp_path: Path):
+    ram = tmp_path / 'ram'
+    ram.mkdir()
+    with Workspace(tmp_path, ram_path=ram, ram_budget=16) as ws:
+        big = ws.execute(sys.executable, args=_py('print("x" * 32)'))
+        assert big.stdout.parent == tmp_path
+        assert big.out().text() == 'x' * 32 + '\n'
+        small = ws.execute(sys.executable, args=_py('print("y")'))
+        assert small.stdout.parent.parent == ram
+        assert small.out().text() == 'y\n'
+
+
+def test_ram_workspace_persists_timed_out_runs(tmp_path: Path):
+    ram = tmp_path / 'ram'
+    ram.mkdir()
+    with Workspace(tmp_path, ram_path=ram) as ws:
+        with pytest.raises(subprocess.TimeoutExpired):
+            ws.execute(sys.executable, args=_py('import time; print("x", flush=True); time.sleep(5)'), timeout=1)
+    assert [p.read_text() for p in tmp_path.glob('*.stdout')] == ['x\n']
+
+
+def test_ram_workspace_persist(tmp_path: Path):
+    ram = tmp_path / 'ram'
+    ram.mkdir()
+    with Workspace(tmp_path, ram_path=ram) as ws:
+        res = ws.execute(sys.executable, args=_py('print("wrong")'))
+        ws.persist(res)
+    assert res.stdout.parent == tmp_path
+    assert res.out().text() == 'wrong\n'
+
+
+def test_ram_workspace_reserves_budget_for_parallel_runs(tmp_path: Path):
+    ram = tmp_path / 'ram'
+    ram.mkdir()
+    with Workspace(tmp_path, ram_path=ram, ram_budget=100, ram_reserve=100) as ws:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda _: ws.execute(sys.executable, args=_py('import time; time.sleep(0.5)')),
+                                    range(2)))
+        assert sorted(res.stdout.parent == tmp_path for res in results) == [False, True]